@@ -6,18 +6,127 @@ A command-line tool for searching tax records from the Monongalia County Sheriff
 
 import requests
 import argparse
+import atexit
+import gzip
+import hashlib
+import html
+import itertools
 import urllib3
+from requests.adapters import HTTPAdapter
+from requests.cookies import create_cookie
+from urllib3.util.retry import Retry
 import json
 import logging
 import os
+import queue
 import re
+import ssl
+import threading
 import time
 import sys
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from logging.handlers import QueueHandler, QueueListener
 from datetime import datetime
+from types import MappingProxyType
+
+# lxml is optional; it is used to parse pages that don't match the expected results template
+# (a regex parser is used instead when it isn't installed)
+try:
+    from lxml import html as lxml_html
+except ImportError:
+    lxml_html = None
+
+# orjson is optional; it is much faster than the json module for large result sets
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Page count patterns, compiled once per process
+# "Page     1 of &nbsp; 1232" as rendered by the search page, with a more generic fallback
+PAGE_RE = re.compile(r'Page\s+\d+\s+of\s+&nbsp;\s*(\d+)')
+PAGE_RE_FALLBACK = re.compile(r'Page\s+\d+\s+of\s+(\d+)')
+PAGE_INFO_RE = re.compile(r'Page\s+(\d+)\s+of\s+(\d+)')
+
+# Table rows with tax record data are split into rows and cells first, then each cell is matched
+# with a small anchored pattern, so no single pattern has to span (and backtrack over) a whole row
+TR_RE = re.compile(r'<tr class="[^"]*">(.*?)</tr>', re.DOTALL | re.IGNORECASE)
+TD_RE = re.compile(r'<td([^>]*)>(.*?)</td>', re.DOTALL | re.IGNORECASE)
+TICKET_RE = re.compile(r'<A href="TICKET\.html\?TPTYR=\d+&amp;TPTICK=\d+&amp;TPSX=[^"]*"[^>]*>([^<]*)</a>', re.IGNORECASE)
+TDTEXT_RE = re.compile(r'<font class="tdtext">([^<]*)</font>')
+AMOUNT_RE = re.compile(r'</div>\s*([^<]*)</div>', re.IGNORECASE)
+TAG_RE = re.compile(r'<[^>]*>')
+
+# Initial cookies based on the website requirements
+DEFAULT_COOKIES = MappingProxyType({
+    'DIST': '',
+    'EOF': '1',
+    'INDEXPGMF': 'INDEXF.html',
+    'INDEXPGMX': 'INDEXX.html',
+    'INDEXPGM': 'INDEX.html',
+    'LYEAR': '0',
+    'MAP': '',
+    'PARC': '',
+    'PMTINDEXF': 'INDEXFp.html',
+    'PMTINDEXX': 'INDEXXp.html',
+    'PMTINDEX': 'INDEXp.html',
+    'PMTSEARCHF': 'SEARCHFp.html',
+    'PMTSEARCHX': 'SEARCHXp.html',
+    'PMTSEARCH': 'SEARCHp.html',
+    'PMTTICKETF': 'TICKETFp.html',
+    'PMTTICKETX': 'TICKETXp.html',
+    'PMTTICKET': 'TICKETp.html',
+    'PUB': 'B',
+    'RECS': '33',
+    'RN': '34',
+    'RPB': 'B',
+    'SEARCHPGMF': 'SEARCHF.html',
+    'SEARCHPGMX': 'SEARCHX.html',
+    'SEARCHPGM': 'SEARCH.html',
+    'SEARCH': '1',
+    'SPAGE': '1',
+    'SPAR': '',
+    'TICKETPGMF': 'TICKETF.html',
+    'TICKETPGMX': 'TICKETX.html',
+    'TICKETPGM': 'TICKET.html',
+    'TPACCT': '',
+    'TPNAME': '',
+    'TPSX': '',
+    'TPTICK': '',
+    'TPTYR': ''
+})
+
+# Cookies set for each common search parameter; the search forms read both spellings,
+# and district also goes into SDIST for forms that use it
+PARAM_COOKIES = {
+    'limit_year': ('LYEAR', 'lyear'),
+    'prop_type': ('RPB', 'rpb'),
+    'status': ('PUB', 'pub'),
+    'district': ('DIST', 'SDIST'),
+}
+
+# Directory for cached search responses (see --cache-ttl / --no-cache)
+CACHE_DIR = 'cache'
+# Expired entries that have an ETag are kept for revalidation, but never longer than this (seconds)
+CACHE_MAX_AGE = 7 * 24 * 60 * 60
+
+# Write buffer for CSV/text exports, large enough that big result sets need few write() calls
+OUTPUT_BUFFER_SIZE = 1 << 20
+
+# Raw responses are written from a background thread to keep disk I/O off the request path
+response_writer = ThreadPoolExecutor(max_workers=1)
+# Sequence number for raw response files, so responses within the same second don't collide
+response_counter = itertools.count()
 
 # Disable SSL warnings
 urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 
+def dumps_json(obj, indent=False):
+    """Serialize an object to a JSON string, using orjson when it is available"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0).decode('utf-8')
+    return json.dumps(obj, indent=2 if indent else None)
+
 # Set up logging
 def setup_logging(debug_level):
     log_levels = {
@@ -35,69 +144,109 @@ def setup_logging(debug_level):
     timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
     log_file = f'logs/tax_search_{timestamp}.log'
     
+    # Write log records from a background thread so logging in the fetch loop never blocks on disk
+    formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    file_handler = logging.FileHandler(log_file)
+    file_handler.setFormatter(formatter)
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(formatter)
+    
+    log_queue = queue.Queue(-1)
+    listener = QueueListener(log_queue, file_handler, stream_handler)
+    listener.start()
+    atexit.register(listener.stop)
+    
+    # The queue handler only passes the message along; the listener's handlers do the formatting
+    queue_handler = QueueHandler(log_queue)
+    queue_handler.setFormatter(logging.Formatter('%(message)s'))
+    
     # Configure logging
-    logging.basicConfig(
-        level=level,
-        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        handlers=[
-            logging.FileHandler(log_file),
-            logging.StreamHandler()
-        ]
-    )
+    logging.basicConfig(level=level, handlers=[queue_handler])
     
     return logging.getLogger('tax_search')
 
 
-def initialize_session(domain, logger, url=None):
+def set_cookie(session, name, value, domain, path='/'):
+    """Set a session cookie and keep the session's cookie snapshot in step"""
+    session.cookies.set(name, value, domain=domain, path=path)
+    session.cookie_snapshot[name] = value
+
+class InsecureHTTPAdapter(HTTPAdapter):
+    """HTTPAdapter whose pooled connections share one SSL context without certificate verification"""
+    
+    def __init__(self, *args, **kwargs):
+        # HTTPAdapter.__init__ calls init_poolmanager, so the context has to exist first
+        self.ssl_context = ssl.create_default_context()
+        self.ssl_context.check_hostname = False
+        self.ssl_context.verify_mode = ssl.CERT_NONE
+        super().__init__(*args, **kwargs)
+    
+    def init_poolmanager(self, *args, **kwargs):
+        kwargs['ssl_context'] = self.ssl_context
+        return super().init_poolmanager(*args, **kwargs)
+    
+    def send(self, request, **kwargs):
+        # requests lets REQUESTS_CA_BUNDLE/CURL_CA_BUNDLE override session.verify = False,
+        # so verification is switched off here rather than on every session.post() call
+        kwargs['verify'] = False
+        return super().send(request, **kwargs)
+
+def create_http_adapter(pool_maxsize=10):
+    """Create a pooled HTTP adapter that retries connection failures only"""
+    # Every request goes to the same host, so keep a pooled adapter instead of paying a new
+    # TCP/TLS handshake on reconnect. Searches are POSTs, which urllib3 doesn't retry once they
+    # have reached the server: a TASK=NEXT that got there has already advanced the paging
+    # cursor. So only connection failures (which never reached the server) are retried.
+    retry = Retry(total=3, backoff_factor=0.3)
+    return InsecureHTTPAdapter(pool_connections=1, pool_maxsize=pool_maxsize, max_retries=retry)
+
+def submit_daemon(fn, *args):
+    """Run fn(*args) on a daemon thread and return a Future for its result"""
+    # Unlike an executor's worker, a daemon thread doesn't hold up Ctrl-C or interpreter exit
+    # while a request to a stalled server is still waiting on its timeout
+    future = Future()
+    
+    def run():
+        if not future.set_running_or_notify_cancel():
+            return
+        try:
+            future.set_result(fn(*args))
+        except BaseException as e:
+            future.set_exception(e)
+    
+    threading.Thread(target=run, daemon=True).start()
+    return future
+
+class CacheChainBroken(Exception):
+    """Raised when a search replayed from the cache reaches a page that isn't cached"""
+
+def initialize_session(domain, logger, url=None, user_agent=None, adapter=None):
     """Initialize a session with required cookies"""
     session = requests.Session()
     session.verify = False  # Disable SSL certificate verification
     
-    # Set the initial cookies based on the website requirements
-    cookies = {
-        'DIST': '',
-        'EOF': '1',
-        'INDEXPGMF': 'INDEXF.html',
-        'INDEXPGMX': 'INDEXX.html',
-        'INDEXPGM': 'INDEX.html',
-        'LYEAR': '0',
-        'MAP': '',
-        'PARC': '',
-        'PMTINDEXF': 'INDEXFp.html',
-        'PMTINDEXX': 'INDEXXp.html',
-        'PMTINDEX': 'INDEXp.html',
-        'PMTSEARCHF': 'SEARCHFp.html',
-        'PMTSEARCHX': 'SEARCHXp.html',
-        'PMTSEARCH': 'SEARCHp.html',
-        'PMTTICKETF': 'TICKETFp.html',
-        'PMTTICKETX': 'TICKETXp.html',
-        'PMTTICKET': 'TICKETp.html',
-        'PUB': 'B',
-        'RECS': '33',
-        'RN': '34',
-        'RPB': 'B',
-        'SEARCHPGMF': 'SEARCHF.html',
-        'SEARCHPGMX': 'SEARCHX.html',
-        'SEARCHPGM': 'SEARCH.html',
-        'SEARCH': '1',
-        'SPAGE': '1',
-        'SPAR': '',
-        'TICKETPGMF': 'TICKETF.html',
-        'TICKETPGMX': 'TICKETX.html',
-        'TICKETPGM': 'TICKET.html',
-        'TPACCT': '',
-        'TPNAME': '',
-        'TPSX': '',
-        'TPTICK': '',
-        'TPTYR': ''
-    }
-    
-    # Add the cookies to the session
-    for key, value in cookies.items():
-        session.cookies.set(key, value, domain=domain, path='/')
+    # Sessions can share one adapter (and so one connection pool), as batch searches do
+    if adapter is None:
+        adapter = create_http_adapter()
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    
+    session.headers.update({
+        'Connection': 'keep-alive',
+        'Accept-Encoding': 'gzip, deflate',
+    })
+    if user_agent:
+        session.headers['User-Agent'] = user_agent
+    
+    # Add the initial cookies to the session in one pass, tracking a plain snapshot of them for
+    # logging and cache keys
+    for key, value in DEFAULT_COOKIES.items():
+        session.cookies.set_cookie(create_cookie(key, value, domain=domain, path='/'))
+    session.cookie_snapshot = dict(DEFAULT_COOKIES)
     
     logger.info("Session initialized with required cookies")
-    logger.debug(f"Cookies set: {json.dumps(dict(session.cookies.items()), indent=2)}")
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(f"Cookies set: {dumps_json(session.cookie_snapshot, indent=True)}")
     
     return session
 
@@ -106,7 +255,7 @@ def search_by_name(session, name, common_params, domain, logger, max_pages=None,
     logger.info(f"Performing name search for: {name}")
     
     # Update the TPNAME cookie with the search name
-    session.cookies.set('TPNAME', name, domain=domain, path='/')
+    set_cookie(session, 'TPNAME', name, domain)
     
     # Start with the name-specific payload
     payload = {
@@ -125,7 +274,7 @@ def search_by_account(session, account_number, common_params, domain, logger, ma
     logger.info(f"Performing account search for: {account_number}")
     
     # Update the TPACCT cookie
-    session.cookies.set('TPACCT', account_number, domain=domain, path='/')
+    set_cookie(session, 'TPACCT', account_number, domain)
     
     # Start with the account-specific payload
     payload = {
@@ -144,9 +293,9 @@ def search_by_ticket(session, year, ticket_number, suffix, common_params, domain
     logger.info(f"Performing ticket search for year: {year}, ticket: {ticket_number}, suffix: {suffix}")
     
     # Update relevant cookies
-    session.cookies.set('TPTYR', year, domain=domain, path='/')
-    session.cookies.set('TPTICK', ticket_number, domain=domain, path='/')
-    session.cookies.set('TPSX', suffix, domain=domain, path='/')
+    set_cookie(session, 'TPTYR', year, domain)
+    set_cookie(session, 'TPTICK', ticket_number, domain)
+    set_cookie(session, 'TPSX', suffix, domain)
     
     # Start with the ticket-specific payload
     payload = {
@@ -168,10 +317,10 @@ def search_by_map(session, district, map_num, parcel, sub_parcel, common_params,
                 f"parcel: {parcel}, sub-parcel: {sub_parcel}")
     
     # Update map-specific cookies
-    session.cookies.set('DIST', district, domain=domain, path='/')
-    session.cookies.set('MAP', map_num, domain=domain, path='/')
-    session.cookies.set('PARC', parcel, domain=domain, path='/')
-    session.cookies.set('SPAR', sub_parcel, domain=domain, path='/')
+    set_cookie(session, 'DIST', district, domain)
+    set_cookie(session, 'MAP', map_num, domain)
+    set_cookie(session, 'PARC', parcel, domain)
+    set_cookie(session, 'SPAR', sub_parcel, domain)
     
     # Start with the map-specific payload
     payload = {
@@ -190,33 +339,14 @@ def search_by_map(session, district, map_num, parcel, sub_parcel, common_params,
     
 def apply_common_params(session, params, domain, logger):
     """Apply common search parameters to the session cookies and payload"""
-    # Map parameter names to cookie names
-    param_to_cookie = {
-        'limit_year': 'LYEAR',
-        'prop_type': 'RPB',
-        'status': 'PUB',
-        'district': 'DIST',
-    }
-    
     if params:
         logger.info(f"Applying common search parameters: {params}")
         
         for param, value in params.items():
-            if value and param in param_to_cookie:
-                cookie_name = param_to_cookie[param]
-                logger.debug(f"Setting {cookie_name} cookie to '{value}'")
-                session.cookies.set(cookie_name, value, domain=domain, path='/')
-                
-                # Also add to the URL payload if needed
-                if param == 'limit_year':
-                    session.cookies.set('lyear', value, domain=domain, path='/')
-                elif param == 'prop_type':
-                    session.cookies.set('rpb', value, domain=domain, path='/')
-                elif param == 'status':
-                    session.cookies.set('pub', value, domain=domain, path='/')
-                elif param == 'district':
-                    # Also set SDIST for forms that use it
-                    session.cookies.set('SDIST', value, domain=domain, path='/')
+            if value and param in PARAM_COOKIES:
+                for cookie_name in PARAM_COOKIES[param]:
+                    logger.debug(f"Setting {cookie_name} cookie to '{value}'")
+                    set_cookie(session, cookie_name, value, domain)
 
 def perform_search_with_pagination(session, initial_payload, domain, logger, max_pages=None, url=None):
     """Perform a search and handle pagination"""
@@ -228,23 +358,28 @@ def perform_search_with_pagination(session, initial_payload, domain, logger, max
     total_pages = None
     headers = ["Ticket", "Type", "Taxpayer Name", "Address", "Half Yr Tax", "Page"]
     
+    # Batch searches run several of these at once, so they turn console progress off
+    show_progress = getattr(session, 'show_progress', True)
+    
     # Use tqdm for progress bar if available
-    try:
-        from tqdm import tqdm
-        progress_enabled = True
-    except ImportError:
-        progress_enabled = False
-        logger.warning("tqdm not installed, progress bar disabled")
+    progress_enabled = False
+    if show_progress:
+        try:
+            from tqdm import tqdm
+            progress_enabled = True
+        except ImportError:
+            logger.warning("tqdm not installed, progress bar disabled")
     
     # Perform the initial search to get first page of results
     logger.info(f"Processing page {current_page}")
-    print(f"Processing page {current_page}...", end="\r", flush=True)
+    if show_progress:
+        print(f"Processing page {current_page}...", end="\r", flush=True)
     
     # Set the page cookie
-    session.cookies.set('SPAGE', str(current_page), domain=domain, path='/')
+    set_cookie(session, 'SPAGE', str(current_page), domain)
     
     # Get first page of results
-    response = perform_search(session, initial_payload, domain, logger, url)
+    response = perform_search(session, initial_payload, domain, logger, url, page=current_page)
     if not response:
         logger.error("Initial search failed")
         return "Search failed - no response from server"
@@ -271,28 +406,51 @@ def perform_search_with_pagination(session, initial_payload, domain, logger, max
     else:
         progress_bar = None
     
+    # For pagination, we need to use the NEXT link/button which requires a special payload
+    # The HTML shows 'SEARCH.html?TASK=NEXT' is used for the Next page link
+    next_payload = {'TASK': 'NEXT'}
+    
+    def has_more_pages(page):
+        return (total_pages is not None and page < total_pages) and (max_pages is None or page < max_pages)
+    
+    # The server tracks our position for NEXT, so pages must be requested one at a time and in
+    # order. A background thread fetches the next page while the current one is parsed.
+    pending = None
+    if has_more_pages(current_page):
+        pending = submit_daemon(perform_search, session, next_payload, domain, logger, url, current_page + 1)
+    
     # Process all remaining pages
-    while (total_pages is not None and current_page < total_pages) and (max_pages is None or current_page < max_pages):
+    last_print = time.monotonic()
+    restart_live = False
+    while pending is not None:
         # Move to next page
         current_page += 1
         
         logger.info(f"Processing page {current_page} of {total_pages}")
-        print(f"Processing page {current_page} of {total_pages}...", end="\r", flush=True)
         
-        # Update progress bar
+        # Update progress bar, or print progress at most every 0.2s when tqdm isn't available
         if progress_bar:
+            progress_bar.set_postfix_str(f"page {current_page}/{total_pages}", refresh=False)
             progress_bar.update(1)
+        elif show_progress and (current_page % 10 == 0 or time.monotonic() - last_print > 0.2):
+            print(f"Processing page {current_page} of {total_pages}...", end="\r", flush=True)
+            last_print = time.monotonic()
         
-        # For pagination, we need to use the NEXT link/button which requires a special payload
-        # The HTML shows 'SEARCH.html?TASK=NEXT' is used for the Next page link
-        next_payload = {'TASK': 'NEXT'}
-        
-        # Get the next page of results
-        response = perform_search(session, next_payload, domain, logger, url)
+        # Wait for the next page of results
+        try:
+            response = pending.result()
+        except CacheChainBroken:
+            restart_live = True
+            break
+        pending = None
         if not response:
             logger.error(f"Failed to get page {current_page}")
             break
         
+        # Request the following page before parsing this one
+        if has_more_pages(current_page):
+            pending = submit_daemon(perform_search, session, next_payload, domain, logger, url, current_page + 1)
+        
         # Extract results from this page
         _, page_results = extract_search_results(response, logger, current_page)
         
@@ -303,17 +461,28 @@ def perform_search_with_pagination(session, initial_payload, domain, logger, max
         # Add this page's results to our collection
         all_results.extend(page_results)
     
+    # A page may still be in flight if we stopped early; let it finish before the session is
+    # used again. Ctrl-C doesn't wait for it, as the fetch runs on a daemon thread.
+    if pending is not None:
+        pending.exception()
+    
     # Close progress bar if it was created
     if progress_bar:
         progress_bar.close()
     
+    # The cache only held the first part of this search, so run the whole search again live
+    if restart_live:
+        logger.info(f"Page {current_page} is not cached; repeating the search without the cache")
+        session.cache_live_only = True
+        return perform_search_with_pagination(session, initial_payload, domain, logger, max_pages, url)
+    
     # Final count info
     logger.info(f"Retrieved {len(all_results)} records from {current_page} page(s)")
     
     # Return the combined results with headers
     return {"headers": headers, "data": all_results, "pagination": {"current_page": current_page, "total_pages": total_pages}}
 
-def perform_search(session, payload, domain, logger, url=None):
+def perform_search(session, payload, domain, logger, url=None, page=None):
     """Execute the search with the provided payload"""
     # Use the provided URL if available, otherwise construct using domain
     if url:
@@ -326,29 +495,86 @@ def perform_search(session, payload, domain, logger, url=None):
     else:
         url = f"https://{domain}/SEARCH.html"
     
-    logger.debug(f"Request URL: {url}")
-    logger.debug(f"Request Payload: {json.dumps(payload, indent=2)}")
-    logger.debug(f"Request Cookies: {json.dumps(dict(session.cookies.items()), indent=2)}")
+    # Only serialize the payload and cookies when debug logging will actually emit them
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(f"Request URL: {url}")
+        logger.debug(f"Request Payload: {dumps_json(payload, indent=True)}")
+        logger.debug(f"Request Cookies: {dumps_json(session.cookie_snapshot, indent=True)}")
+    
+    # Serve repeated searches from the local cache when enabled (see --cache-ttl)
+    cache_ttl = getattr(session, 'cache_ttl', 0)
+    cache_file = None
+    cached = None
+    request_headers = {}
+    # A cached page can only stand in for a live one while every page before it came from the
+    # cache too: once the server has been asked for a page, its NEXT cursor has to keep moving
+    replaying = getattr(session, 'cache_replaying', False)
+    live_only = getattr(session, 'cache_live_only', False)
+    if cache_ttl:
+        cache_file = os.path.join(CACHE_DIR, f"{cache_key(url, payload, session, page)}.json.gz")
+        cached, age = load_cached_response(cache_file)
+        if cached is not None:
+            if age < cache_ttl and not live_only and (page is None or page == 1 or replaying):
+                logger.info(f"Using cached response ({age:.0f} seconds old) from: {cache_file}")
+                apply_cached_cookies(session, cached['cookies'])
+                session.cache_replaying = True
+                return cached['text']
+            if cached.get('etag'):
+                request_headers['If-None-Match'] = cached['etag']
+            else:
+                # Nothing to revalidate with, so the expired entry is of no further use
+                remove_cached_response(cache_file, logger)
+    
+    # This request goes to the server. If the earlier pages were replayed from the cache, the
+    # server's cursor never moved past the start, so a live NEXT would return the wrong page
+    if replaying and page is not None and page > 1:
+        raise CacheChainBroken(f"Page {page} is not cached")
+    session.cache_replaying = False
+    session.cache_live_only = True
     
     try:
         start_time = time.time()
-        response = session.post(url, data=payload, verify=False)
+        response = session.post(url, data=payload, headers=request_headers,
+                                timeout=getattr(session, 'timeout', None))
         elapsed_time = time.time() - start_time
         
         logger.info(f"Response received in {elapsed_time:.2f} seconds with status code: {response.status_code}")
         
+        # Keep the cookie snapshot in step with any cookies the server set
+        for r in response.history + [response]:
+            session.cookie_snapshot.update((c.name, c.value) for c in r.cookies)
+        
+        if response.status_code == 304 and cached is not None:
+            logger.info(f"Cached response is still current: {cache_file}")
+            os.utime(cache_file)
+            apply_cached_cookies(session, cached['cookies'])
+            return cached['text']
+        
         if response.status_code != 200:
             logger.error(f"Error: Received status code {response.status_code}")
             return None
         
-        # Save the raw HTML response to a file for inspection
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-        response_file = f'logs/response_{timestamp}.html'
-        with open(response_file, 'w', encoding='utf-8') as f:
-            f.write(response.text)
-        logger.info(f"Raw response saved to: {response_file}")
+        # Decode the body exactly once. Without a charset in Content-Type, requests would assume
+        # ISO-8859-1 for text/html (or run charset detection), so use UTF-8 explicitly instead
+        if 'charset=' not in response.headers.get('Content-Type', '').lower():
+            response.encoding = 'utf-8'
+        try:
+            html_content = response.content.decode(response.encoding, errors='replace')
+        except (LookupError, TypeError):
+            # The server named a charset Python doesn't know (or an empty one), so fall back to UTF-8
+            logger.warning(f"Unknown response charset {response.encoding!r}; decoding as UTF-8")
+            html_content = response.content.decode('utf-8', errors='replace')
+        
+        # Save the raw HTML response for inspection when debugging (-vv)
+        if logger.isEnabledFor(logging.DEBUG):
+            timestamp = time.strftime('%Y%m%d_%H%M%S')
+            response_file = f'logs/response_{timestamp}_{next(response_counter):04d}.html.gz'
+            response_writer.submit(save_raw_response, html_content, response_file, logger)
+        
+        if cache_file:
+            store_cached_response(cache_file, response, html_content, logger)
         
-        return response.text
+        return html_content
         
     except requests.exceptions.RequestException as e:
         logger.error(f"Request failed: {str(e)}")
@@ -357,50 +583,305 @@ def perform_search(session, payload, domain, logger, url=None):
         logger.error(f"Unexpected error: {str(e)}")
         return None
 
+def cache_key(url, payload, session, page):
+    """Build a cache key from everything that determines the server's response"""
+    key_data = json.dumps([url, sorted(payload.items()), sorted(session.cookie_snapshot.items()), page])
+    return hashlib.blake2b(key_data.encode('utf-8'), digest_size=16).hexdigest()
+
+def load_cached_response(cache_file):
+    """Load a cached response, returning the entry and its age in seconds (or None, None)"""
+    try:
+        age = time.time() - os.path.getmtime(cache_file)
+        with gzip.open(cache_file, 'rt', encoding='utf-8') as f:
+            return json.load(f), age
+    except (OSError, ValueError):
+        return None, None
+
+def store_cached_response(cache_file, response, html_content, logger):
+    """Save a response to the cache along with the cookies it set"""
+    if 'no-store' in response.headers.get('Cache-Control', ''):
+        logger.debug("Response marked no-store, not caching")
+        return
+    
+    # The server keeps the search position in cookies, so replay them on a cache hit
+    entry = {
+        'text': html_content,
+        'etag': response.headers.get('ETag'),
+        'cookies': [[c.name, c.value, c.domain, c.path] for c in response.cookies],
+    }
+    
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        with gzip.open(cache_file, 'wt', compresslevel=1, encoding='utf-8') as f:
+            json.dump(entry, f)
+        logger.debug(f"Response cached to: {cache_file}")
+    except OSError as e:
+        logger.error(f"Failed to cache response: {str(e)}")
+
+def remove_cached_response(cache_file, logger):
+    """Delete a cache entry, ignoring entries that are already gone"""
+    try:
+        os.remove(cache_file)
+        logger.debug(f"Removed expired cache entry: {cache_file}")
+    except FileNotFoundError:
+        pass
+    except OSError as e:
+        logger.warning(f"Failed to remove cache entry {cache_file}: {str(e)}")
+
+def prune_response_cache(cache_ttl, logger):
+    """Delete expired cached responses, keeping ones that can still be revalidated by ETag"""
+    if not os.path.isdir(CACHE_DIR):
+        return
+    
+    now = time.time()
+    removed = 0
+    for filename in os.listdir(CACHE_DIR):
+        if not filename.endswith('.json.gz'):
+            continue
+        cache_file = os.path.join(CACHE_DIR, filename)
+        try:
+            age = now - os.path.getmtime(cache_file)
+        except OSError:
+            continue
+        if age < cache_ttl:
+            continue
+        
+        # Expired entries with an ETag can still be revalidated, up to CACHE_MAX_AGE
+        if age < CACHE_MAX_AGE:
+            cached, _ = load_cached_response(cache_file)
+            if cached is not None and cached.get('etag'):
+                continue
+        
+        remove_cached_response(cache_file, logger)
+        removed += 1
+    
+    if removed:
+        logger.info(f"Removed {removed} expired response(s) from the cache")
+
+def apply_cached_cookies(session, cookies):
+    """Apply the cookies a cached response originally set"""
+    for name, value, domain, path in cookies:
+        set_cookie(session, name, value, domain, path)
+
+def save_raw_response(text, response_file, logger):
+    """Write a raw HTML response to a gzip-compressed log file"""
+    try:
+        with gzip.open(response_file, 'wt', compresslevel=1, encoding='utf-8') as f:
+            f.write(text)
+        logger.debug(f"Raw response saved to: {response_file}")
+    except OSError as e:
+        logger.error(f"Failed to save raw response: {str(e)}")
+
 def extract_search_results(html_content, logger, current_page):
     """Extract search results from the HTML response"""
     # Find the total pages info - looking for the format in the example: "Page     1 of &nbsp; 1232"
     total_pages = None
-    page_info_match = re.search(r'Page\s+\d+\s+of\s+&nbsp;\s*(\d+)', html_content)
+    page_info_match = PAGE_RE.search(html_content)
     if page_info_match:
         total_pages = int(page_info_match.group(1))
         logger.info(f"Total pages: {total_pages}")
     else:
         # Try a more generic pattern as fallback
-        page_info_match = re.search(r'Page\s+\d+\s+of\s+(\d+)', html_content)
+        page_info_match = PAGE_RE_FALLBACK.search(html_content)
         if page_info_match:
             total_pages = int(page_info_match.group(1))
             logger.info(f"Total pages: {total_pages}")
     
     # Extract each record from the table rows
     results = []
+    expected_rows = count_record_rows(html_content)
     
-    # Find all table rows with tax record data - pattern based on the example HTML
-    row_pattern = r'<tr class="[^"]*">\s*<TD class=left[^>]*>.*?<A href="TICKET\.html\?TPTYR=(\d+)&amp;TPTICK=(\d+)&amp;TPSX=([^"]*)"[^>]*>(\d+ -\s*\d+\s*[^<]*)</a>.*?</TD>\s*<td>.*?(?:<A[^>]*>([^<]*)</A>|([^<]*)).*?</td>\s*<td>.*?<font class="tdtext">([^<]*)</font></td>\s*<td>.*?<font class="tdtext">([^<]*)</font></td>\s*<td[^>]*>.*?<div[^>]*>.*?<div[^>]*>.*?</div>\s*([^<]*)</div>\s*</td>\s*</tr>'
-    
-    record_matches = re.finditer(row_pattern, html_content, re.DOTALL)
-    
-    for match in record_matches:
-        tax_year = match.group(1)
-        ticket_number = match.group(2)
-        suffix = match.group(3).strip()
-        ticket_display = match.group(4).strip()
-        
-        # Type might be in either group 5 or 6 depending on if there's a link
-        record_type = match.group(5) if match.group(5) else match.group(6)
-        record_type = record_type.strip() if record_type else ""
-        
-        taxpayer_name = match.group(7).strip()
-        address = match.group(8).strip()
-        amount = match.group(9).strip()
-        
+    for ticket_display, record_type, taxpayer_name, address, amount in parse_record_rows(html_content, expected_rows):
         # Create a data row and add page number
         row = [ticket_display, record_type, taxpayer_name, address, amount, f"Page {current_page}"]
         results.append(row)
     
+    # Table rows that no parser could read usually mean the page layout has changed
+    if not results and '<tr class=' in html_content:
+        logger.warning(f"Page {current_page} has table rows but no records could be parsed from them; "
+                       f"the results page layout may have changed")
+    elif len(results) < expected_rows:
+        logger.warning(f"Page {current_page} has {expected_rows} record rows but only {len(results)} could be "
+                       f"parsed; the results page layout may have changed")
+    
     logger.info(f"Extracted {len(results)} records from page {current_page}")
     return total_pages, results
 
+def parse_record_rows(html_content, expected_rows=None):
+    """Return (ticket, type, name, address, amount) tuples for each record row in the page"""
+    rows = parse_record_rows_scan(html_content)
+    if expected_rows is None:
+        expected_rows = count_record_rows(html_content)
+    
+    # If some rows don't follow the expected template, let lxml (or the regex parser
+    # when lxml isn't installed) have a go at the page, keeping whichever parsed more
+    if len(rows) < expected_rows or not rows:
+        if lxml_html is not None:
+            fallback_rows = parse_record_rows_lxml(html_content)
+        else:
+            fallback_rows = parse_record_rows_regex(html_content)
+        if len(fallback_rows) > len(rows):
+            rows = fallback_rows
+    return rows
+
+def count_record_rows(html_content):
+    """Count the <tr class=...> rows that link to a ticket page, i.e. the rows that hold records"""
+    count = 0
+    pos = 0
+    
+    while True:
+        row_start = html_content.find('<tr class=', pos)
+        if row_start < 0:
+            break
+        row_end = html_content.find('</tr>', row_start)
+        if row_end < 0:
+            break
+        pos = row_end + len('</tr>')
+        
+        if html_content.find('TPTYR=', row_start, row_end) >= 0:
+            count += 1
+    
+    return count
+
+def parse_record_rows_lxml(html_content):
+    """Parse record rows with lxml (fallback for pages that don't match the expected template)"""
+    tree = lxml_html.fromstring(html_content)
+    rows = []
+    
+    for row in tree.xpath('//tr[@class]'):
+        cells = row.xpath('./td')
+        if len(cells) < 5 or cells[0].get('class') != 'left':
+            continue
+        
+        # The first cell links to the ticket page (TICKET.html?TPTYR=...&TPTICK=...&TPSX=...)
+        links = cells[0].xpath('.//a[contains(@href, "TPTYR=")]')
+        if not links:
+            continue
+        
+        ticket_display = links[0].text_content().strip()
+        record_type = cells[1].text_content().strip()
+        
+        # Name and address are wrapped in <font class="tdtext">
+        name_fonts = cells[2].xpath('.//font[@class="tdtext"]')
+        address_fonts = cells[3].xpath('.//font[@class="tdtext"]')
+        taxpayer_name = name_fonts[0].text_content().strip() if name_fonts else ""
+        address = address_fonts[0].text_content().strip() if address_fonts else ""
+        
+        # The amount is the text following the inner <div> of the last cell
+        inner_divs = cells[4].xpath('.//div/div')
+        amount = (inner_divs[-1].tail or "").strip() if inner_divs else ""
+        
+        rows.append((ticket_display, record_type, taxpayer_name, address, amount))
+    
+    return rows
+
+def parse_record_rows_scan(html_content):
+    """Parse record rows by scanning for the fixed markers of the results page template"""
+    rows = []
+    pos = 0
+    
+    while True:
+        # Each record is a <tr class="..."> row; find() with bounds keeps the scan linear and copy-free
+        row_start = html_content.find('<tr class=', pos)
+        if row_start < 0:
+            break
+        row_end = html_content.find('</tr>', row_start)
+        if row_end < 0:
+            break
+        pos = row_end + len('</tr>')
+        
+        # The first cell links to the ticket page (TICKET.html?TPTYR=...&TPTICK=...&TPSX=...)
+        first_cell = html_content.find('<TD class=left', row_start, row_end)
+        ticket_link = html_content.find('TPTYR=', first_cell, row_end) if first_cell >= 0 else -1
+        if ticket_link < 0:
+            continue
+        link_text_start = html_content.find('>', ticket_link, row_end) + 1
+        link_text_end = html_content.find('</a>', link_text_start, row_end)
+        first_cell_end = html_content.find('</TD>', link_text_end, row_end)
+        if link_text_start <= 0 or link_text_end < 0 or first_cell_end < 0:
+            continue
+        
+        # The type cell may or may not wrap its text in a link
+        type_cell = html_content.find('<td', first_cell_end, row_end)
+        type_start = html_content.find('>', type_cell, row_end) + 1
+        type_end = html_content.find('</td>', type_start, row_end)
+        if type_cell < 0 or type_start <= 0 or type_end < 0:
+            continue
+        
+        # Name and address are wrapped in <font class="tdtext">
+        name_start = html_content.find('<font class="tdtext">', type_end, row_end)
+        name_end = html_content.find('</font>', name_start, row_end)
+        if name_start < 0 or name_end < 0:
+            continue
+        address_start = html_content.find('<font class="tdtext">', name_end, row_end)
+        address_end = html_content.find('</font>', address_start, row_end)
+        if address_start < 0 or address_end < 0:
+            continue
+        
+        # The amount is the text between the inner and outer </div> of the last cell
+        amount_cell = html_content.find('<td', address_end, row_end)
+        amount_cell_end = html_content.find('</td>', amount_cell, row_end)
+        outer_div_end = html_content.rfind('</div>', amount_cell, amount_cell_end)
+        inner_div_end = html_content.rfind('</div>', amount_cell, outer_div_end)
+        if amount_cell < 0 or amount_cell_end < 0 or outer_div_end < 0 or inner_div_end < 0:
+            continue
+        
+        ticket_display = html.unescape(html_content[link_text_start:link_text_end]).strip()
+        record_type = html.unescape(strip_tags(html_content[type_start:type_end])).strip()
+        taxpayer_name = html.unescape(html_content[name_start + len('<font class="tdtext">'):name_end]).strip()
+        address = html.unescape(html_content[address_start + len('<font class="tdtext">'):address_end]).strip()
+        amount = html.unescape(html_content[inner_div_end + len('</div>'):outer_div_end]).strip()
+        
+        rows.append((ticket_display, record_type, taxpayer_name, address, amount))
+    
+    return rows
+
+def parse_record_rows_regex(html_content):
+    """Parse record rows with small per-cell regexes (fallback for unexpected pages when lxml is not installed)"""
+    rows = []
+    
+    for row_match in TR_RE.finditer(html_content):
+        cells = TD_RE.findall(row_match.group(1))
+        if len(cells) < 5 or 'class=left' not in cells[0][0].lower():
+            continue
+        
+        ticket_match = TICKET_RE.search(cells[0][1])
+        if not ticket_match:
+            continue
+        
+        ticket_display = html.unescape(ticket_match.group(1)).strip()
+        record_type = html.unescape(TAG_RE.sub('', cells[1][1])).strip()
+        
+        # Name and address are wrapped in <font class="tdtext">
+        name_match = TDTEXT_RE.search(cells[2][1])
+        address_match = TDTEXT_RE.search(cells[3][1])
+        taxpayer_name = html.unescape(name_match.group(1)).strip() if name_match else ""
+        address = html.unescape(address_match.group(1)).strip() if address_match else ""
+        
+        # The amount is the text following the inner <div> of the last cell
+        amount_match = AMOUNT_RE.search(cells[4][1])
+        amount = html.unescape(amount_match.group(1)).strip() if amount_match else ""
+        
+        rows.append((ticket_display, record_type, taxpayer_name, address, amount))
+    
+    return rows
+
+def strip_tags(fragment):
+    """Return the text of an HTML fragment with its tags removed"""
+    parts = []
+    pos = 0
+    while True:
+        tag_start = fragment.find('<', pos)
+        if tag_start < 0:
+            parts.append(fragment[pos:])
+            break
+        parts.append(fragment[pos:tag_start])
+        tag_end = fragment.find('>', tag_start)
+        if tag_end < 0:
+            break
+        pos = tag_end + 1
+    return ''.join(parts)
+
 def save_results_to_file(results, output_file, logger):
     """Save results to a file (CSV, JSON, Excel, or text)"""
     logger.info(f"Saving results to {output_file}")
@@ -418,11 +899,15 @@ def save_results_to_file(results, output_file, logger):
         if ext == '.xlsx':
             save_to_excel(results, output_file, logger)
         elif ext == '.json':
-            with open(output_file, 'w', encoding='utf-8') as f:
-                json.dump(results, f, indent=2)
+            if orjson is not None:
+                with open(output_file, 'wb') as f:
+                    f.write(orjson.dumps(results, option=orjson.OPT_INDENT_2))
+            else:
+                with open(output_file, 'w', encoding='utf-8') as f:
+                    json.dump(results, f, indent=2)
         elif ext == '.csv':
             import csv
-            with open(output_file, 'w', newline='', encoding='utf-8') as f:
+            with open(output_file, 'w', newline='', encoding='utf-8', buffering=OUTPUT_BUFFER_SIZE) as f:
                 writer = csv.writer(f)
                 
                 # Write headers
@@ -436,7 +921,7 @@ def save_results_to_file(results, output_file, logger):
                     writer.writerow([results])
         else:
             # Default to text format
-            with open(output_file, 'w', encoding='utf-8') as f:
+            with open(output_file, 'w', encoding='utf-8', buffering=OUTPUT_BUFFER_SIZE) as f:
                 if isinstance(results, dict) and 'headers' in results and 'data' in results:
                     f.write('\t'.join(results['headers']) + '\n')
                     f.write('-' * 80 + '\n')
@@ -458,6 +943,7 @@ def save_to_excel(results, output_file, logger):
     """Save results to an Excel file with formatting"""
     try:
         from openpyxl import Workbook
+        from openpyxl.cell import WriteOnlyCell
         from openpyxl.styles import Font, Alignment, PatternFill
         from openpyxl.utils import get_column_letter
     except ImportError:
@@ -465,60 +951,62 @@ def save_to_excel(results, output_file, logger):
         print("Error: openpyxl is not installed. Please install it with: pip install openpyxl")
         return False
     
-    # Create a new workbook and select the active worksheet
-    wb = Workbook()
-    ws = wb.active
-    ws.title = "Tax Records"
+    # Use a write-only workbook so rows are streamed to disk instead of kept as Cell objects
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet(title="Tax Records")
     
     # Format and populate the data
     if isinstance(results, dict) and 'headers' in results and 'data' in results:
+        # Column widths must be set before any rows are written in write-only mode
+        for col_idx, header in enumerate(results['headers'], 1):
+            column_letter = get_column_letter(col_idx)
+            ws.column_dimensions[column_letter].width = max(12, len(header) + 2)
+        
         # Prepare styling
         header_font = Font(bold=True)
         header_fill = PatternFill(start_color="DDDDDD", end_color="DDDDDD", fill_type="solid")
         center_alignment = Alignment(horizontal='center')
         
         # Write headers
-        for col_idx, header in enumerate(results['headers'], 1):
-            cell = ws.cell(row=1, column=col_idx, value=header)
+        header_cells = []
+        for header in results['headers']:
+            cell = WriteOnlyCell(ws, value=header)
             cell.font = header_font
             cell.fill = header_fill
             cell.alignment = center_alignment
+            header_cells.append(cell)
+        ws.append(header_cells)
         
         # Write data rows
-        for row_idx, row_data in enumerate(results['data'], 2):
-            for col_idx, cell_value in enumerate(row_data, 1):
-                ws.cell(row=row_idx, column=col_idx, value=cell_value)
-        
-        # Auto-adjust column widths
-        for col_idx, header in enumerate(results['headers'], 1):
-            column_letter = get_column_letter(col_idx)
-            ws.column_dimensions[column_letter].width = max(12, len(header) + 2)
+        for row_data in results['data']:
+            ws.append(row_data)
     
     # Create a second sheet with search metadata
     meta_sheet = wb.create_sheet(title="Search Info")
     
+    # Set column widths for metadata
+    meta_sheet.column_dimensions['A'].width = 15
+    meta_sheet.column_dimensions['B'].width = 25
+    
     # Add search metadata
-    meta_sheet['A1'] = "Search Date"
-    meta_sheet['B1'] = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+    metadata = [("Search Date", datetime.now().strftime('%Y-%m-%d %H:%M:%S'))]
     
     # Add record counts
-    meta_sheet['A2'] = "Records Found"
     if isinstance(results, dict) and 'data' in results:
-        meta_sheet['B2'] = len(results['data'])
+        metadata.append(("Records Found", len(results['data'])))
         
         if 'pagination' in results:
-            meta_sheet['A3'] = "Current Page"
-            meta_sheet['B3'] = results['pagination'].get('current_page', 1)
-            meta_sheet['A4'] = "Total Pages"
-            meta_sheet['B4'] = results['pagination'].get('total_pages', 1)
+            metadata.append(("Current Page", results['pagination'].get('current_page', 1)))
+            metadata.append(("Total Pages", results['pagination'].get('total_pages', 1)))
+    else:
+        metadata.append(("Records Found", None))
     
     # Format metadata
-    for row in range(1, 5):
-        meta_sheet.cell(row=row, column=1).font = Font(bold=True)
-    
-    # Set column widths for metadata
-    meta_sheet.column_dimensions['A'].width = 15
-    meta_sheet.column_dimensions['B'].width = 25
+    label_font = Font(bold=True)
+    for label, value in metadata:
+        label_cell = WriteOnlyCell(meta_sheet, value=label)
+        label_cell.font = label_font
+        meta_sheet.append([label_cell, value])
     
     # Save the workbook
     wb.save(output_file)
@@ -533,7 +1021,7 @@ def inspect_log_file(filename=None):
             print("No logs directory found.")
             return
             
-        html_files = [f for f in os.listdir(log_dir) if f.startswith('response_') and f.endswith('.html')]
+        html_files = [f for f in os.listdir(log_dir) if f.startswith('response_') and f.endswith(('.html', '.html.gz'))]
         if not html_files:
             print("No response log files found.")
             return
@@ -544,7 +1032,8 @@ def inspect_log_file(filename=None):
     
     # Open and read the file
     try:
-        with open(filename, 'r', encoding='utf-8') as f:
+        opener = gzip.open if filename.endswith('.gz') else open
+        with opener(filename, 'rt', encoding='utf-8') as f:
             content = f.read()
         
         # Print basic info
@@ -552,27 +1041,18 @@ def inspect_log_file(filename=None):
         print(f"Size: {len(content)} bytes")
         
         # Look for page info
-        page_info = re.search(r'Page\s+(\d+)\s+of\s+(\d+)', content)
+        page_info = PAGE_INFO_RE.search(content)
         if page_info:
             print(f"Page Information: Page {page_info.group(1)} of {page_info.group(2)}")
         
         # Count records
-        row_pattern = r'<tr class="[^"]*">\s*<TD class=left[^>]*>.*?<A href="TICKET\.html\?TPTYR=(\d+)&amp;TPTICK=(\d+)&amp;TPSX=([^"]*)"'
-        records = re.findall(row_pattern, content)
+        records = parse_record_rows(content)
         print(f"Number of records found: {len(records)}")
         
         # Show sample records if any found
         if records:
             print("\nSample Records (first 3):")
-            sample_pattern = r'<tr class="[^"]*">\s*<TD class=left[^>]*>.*?<A[^>]*>(.*?)</a>.*?</TD>\s*<td>.*?(?:<A[^>]*>([^<]*)</A>|([^<]*)).*?</td>\s*<td>.*?<font class="tdtext">([^<]*)</font></td>\s*<td>.*?<font class="tdtext">([^<]*)</font></td>\s*<td[^>]*>.*?<div[^>]*>.*?<div[^>]*>.*?</div>\s*([^<]*)</div>'
-            sample_records = re.findall(sample_pattern, content, re.DOTALL)
-            
-            for i, record in enumerate(sample_records[:3]):
-                ticket = record[0].strip() if record[0] else ""
-                record_type = (record[1] or record[2]).strip()
-                name = record[3].strip()
-                address = record[4].strip()
-                amount = record[5].strip()
+            for i, (ticket, record_type, name, address, amount) in enumerate(records[:3]):
                 print(f"{i+1}. Ticket: {ticket}, Type: {record_type}, Name: {name}, Address: {address}, Amount: {amount}")
         
         print("\nFile inspection complete")
@@ -580,6 +1060,102 @@ def inspect_log_file(filename=None):
     except Exception as e:
         print(f"Error inspecting file: {str(e)}")
 
+def read_batch_names(batch_file):
+    """Read taxpayer names for a batch search, one per line (blank lines, # comments and duplicates are skipped)"""
+    with open(batch_file, 'r', encoding='utf-8') as f:
+        names = [line.strip() for line in f if line.strip() and not line.strip().startswith('#')]
+    
+    unique_names = []
+    seen = set()
+    for name in names:
+        if name not in seen:
+            seen.add(name)
+            unique_names.append(name)
+    return unique_names
+
+def safe_filename(name):
+    """Turn a search term into a safe file name"""
+    return re.sub(r'[^A-Za-z0-9_-]+', '_', name).strip('_') or 'search'
+
+def batch_output_files(names, output_dir):
+    """Map each name to its own CSV file, adding a short hash when two names make the same file name"""
+    output_files = {}
+    used = set()
+    for name in names:
+        base = safe_filename(name)
+        # Compare case-insensitively, as the output directory may be on a case-insensitive filesystem
+        if base.lower() in used:
+            base = f"{base}_{hashlib.blake2b(name.encode('utf-8'), digest_size=4).hexdigest()}"
+        suffix = 1
+        unique = base
+        while unique.lower() in used:
+            suffix += 1
+            unique = f"{base}_{suffix}"
+        used.add(unique.lower())
+        output_files[name] = os.path.join(output_dir, f"{unique}.csv")
+    return output_files
+
+def int_at_least(value, minimum):
+    """Parse an integer argparse value, rejecting anything below minimum"""
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: '{value}'")
+    if number < minimum:
+        raise argparse.ArgumentTypeError(f"must be at least {minimum}, got {number}")
+    return number
+
+def positive_int(value):
+    """argparse type for options that must be a positive integer"""
+    return int_at_least(value, 1)
+
+def non_negative_int(value):
+    """argparse type for options that must be zero or a positive integer"""
+    return int_at_least(value, 0)
+
+def run_batch_search(names, output_dir, common_params, args, logger):
+    """Run name searches concurrently, saving each one's results to a CSV file in output_dir"""
+    logger.info(f"Starting batch search for {len(names)} names with {args.workers} workers")
+    
+    if not os.path.exists(output_dir):
+        os.makedirs(output_dir)
+    
+    # Every search gets its own session (the server tracks paging per session), but they all
+    # share one adapter so connections and TLS handshakes are reused across searches,
+    # with a pool large enough for every worker to keep its own connection
+    adapter = create_http_adapter(pool_maxsize=max(10, args.workers))
+    
+    # Work out every output file up front so no two searches ever write the same file
+    output_files = batch_output_files(names, output_dir)
+    
+    def search_one(name):
+        session = initialize_session(args.domain, logger, user_agent=args.user_agent, adapter=adapter)
+        session.timeout = args.timeout
+        session.cache_ttl = 0 if args.no_cache else args.cache_ttl
+        session.show_progress = False
+        
+        results = search_by_name(session, name, common_params, args.domain, logger, args.max_pages, args.url)
+        
+        output_file = output_files[name]
+        if isinstance(results, dict) and save_results_to_file(results, output_file, logger):
+            return f"{len(results['data'])} records saved to {output_file}"
+        return str(results)
+    
+    completed = 0
+    with ThreadPoolExecutor(max_workers=args.workers) as executor:
+        futures = {executor.submit(search_one, name): name for name in names}
+        for future in as_completed(futures):
+            name = futures[future]
+            completed += 1
+            try:
+                summary = future.result()
+            except Exception as e:
+                logger.error(f"Batch search for {name} failed: {str(e)}")
+                summary = f"Failed: {str(e)}"
+            print(f"[{completed}/{len(names)}] {name}: {summary}")
+    
+    logger.info("Batch search complete")
+
 def main():
     """Main function to run the tax search tool"""
     # Create the main parser
@@ -599,6 +1175,16 @@ def main():
                       help='User agent string to use for requests')
     parser.add_argument('--max-pages', '-mp', type=int, default=None,
                       help='Maximum number of pages to retrieve (default: all)')
+    parser.add_argument('--cache-ttl', type=non_negative_int, default=600,
+                      help='Reuse cached responses younger than this many seconds (default: 600)')
+    parser.add_argument('--no-cache', action='store_true',
+                      help='Disable the local response cache')
+    parser.add_argument('--batch', '-b', metavar='FILE',
+                      help='Run a name search for each line of FILE, saving results as CSV files')
+    parser.add_argument('--batch-dir', default='batch_results',
+                      help='Directory for batch search results (default: batch_results)')
+    parser.add_argument('--workers', '-w', type=positive_int, default=8,
+                      help='Number of concurrent searches in batch mode (default: 8)')
     parser.add_argument('--inspect', '-i', nargs='?', const='', 
                       help='Inspect a log file (or most recent if not specified)')
     
@@ -646,6 +1232,32 @@ def main():
     logger = setup_logging(args.debug)
     logger.info(f"Tax Search Tool started with arguments: {vars(args)}")
     
+    # Clear out expired responses so the cache doesn't grow without bound
+    if not args.no_cache:
+        prune_response_cache(args.cache_ttl, logger)
+    
+    # Collect common parameters for all search types
+    common_params = {
+        'limit_year': args.limit_year,
+        'prop_type': args.prop_type,
+        'status': args.status,
+        'district': args.district,  # Add district to common params
+    }
+    
+    # Batch mode runs a name search for every line of the batch file
+    if args.batch:
+        try:
+            names = read_batch_names(args.batch)
+        except OSError as e:
+            print(f"Error: Could not read batch file: {str(e)}")
+            logger.error(f"Could not read batch file {args.batch}: {str(e)}")
+            return
+        
+        print(f"Starting batch search for {len(names)} names... (URL: {args.url})")
+        run_batch_search(names, args.batch_dir, common_params, args, logger)
+        print(f"\nBatch results saved to {args.batch_dir}")
+        return
+    
     # If no search type was provided, show help and exit
     if not args.search_type:
         parser.print_help()
@@ -662,19 +1274,11 @@ def main():
             return
     
     # Initialize session with cookies
-    session = initialize_session(args.domain, logger)
+    session = initialize_session(args.domain, logger, user_agent=args.user_agent)
     
-    # Set custom user agent and timeout
-    session.headers.update({'User-Agent': args.user_agent})
+    # Set request timeout and response cache lifetime
     session.timeout = args.timeout
-    
-    # Collect common parameters for all search types
-    common_params = {
-        'limit_year': args.limit_year,
-        'prop_type': args.prop_type,
-        'status': args.status,
-        'district': args.district,  # Add district to common params
-    }
+    session.cache_ttl = 0 if args.no_cache else args.cache_ttl
     
     print(f"Starting search... (Type: {args.search_type}, URL: {args.url})")
     